@@ -102,7 +102,7 @@ class Component:
         )
         if log:
             Logger.log_to_selected(
-                f"Using default for {type(self).__name__} '{self.name}': {attr} = {result}"
+                "Using default for %s '%s': %s = %s", type(self).__name__, self.name, attr, result
             )
         return result
 
@@ -34,7 +34,7 @@ class CoreModel:
         default = Configuration().get_default("CoreModel", "base_mva", platform)
         if default is None:
             raise ValueError("Could not find default value for CoreModel.base_mva")
-        Logger.log_to_selected(f"Using default for {type(self).__name__}: base_mva = {default}")
+        Logger.log_to_selected("Using default for %s: base_mva = %s", type(self).__name__, default)
         return default
 
     def add_component(self, component: Component) -> None:
@@ -306,6 +306,37 @@ class CoreModel:
                 neighbors = new_neighbors
         return neighbors
 
+    def get_single_neighbor(self, component: Component, connector: str) -> Component | None:
+        """Get the first neighbor of [component] connected to [connector].
+        Returns the same as `get_neighbors(component, connector=connector)[0]`,
+        but stops at the first match instead of collecting all neighbors.
+
+        :param component: The component whose neighbor is returned.
+        :type component: Component
+        :param connector: The connector of [component] the neighbor is connected to.
+        :type connector: str
+        :return: The first neighbor connected to [connector] or None if there is none.
+        :rtype: Component | None
+        """
+        from epowcore.gdf.subsystem import Subsystem
+        from epowcore.gdf.port import Port
+
+        graph = self.graph
+        if not graph.has_node(component):
+            _, found = self.get_component_by_id(component.uid)
+            if found is None:
+                return None
+            graph = found
+
+        for neighbor, data in graph[component].items():
+            if connector in data[component.uid]:
+                if isinstance(neighbor, (Port, Subsystem)):
+                    # resolving links may yield several components, keep the order of get_neighbors
+                    neighbors = self.get_neighbors(component, connector=connector)
+                    return neighbors[0] if neighbors else None
+                return neighbor
+        return None
+
     def type_list(self, comp_type: type[T] | list[type[T]]) -> list[T]:
         """List of components of type [comp_type]."""
         if isinstance(comp_type, list):
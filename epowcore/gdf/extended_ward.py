@@ -27,17 +27,23 @@ class ExtendedWard(Ward):
         self,
         core_model: CoreModel,
         base_mva: float = 100.0,
-    ) -> None:
+        new_id: int | None = None,
+    ) -> int:
         """Replaces the Ward equivalent with a Load, a Shunt component, and a VoltageSource in the graph.
 
         :param core_model: The core model to replace the ward in.
         :type core_model: CoreModel
+        :param new_id: The first unused ID for the new components; defaults to None to calculate it
+        :type new_id: int | None, optional
+        :return: The next unused ID after the new components.
+        :rtype: int
         """
         bus: Component = next(core_model.graph.neighbors(self))
         if not isinstance(bus, Bus):
             raise TypeError(f"Expected {self} to be connected to a Bus, but got {bus}.")
 
-        new_id = core_model.get_valid_id()
+        if new_id is None:
+            new_id = core_model.get_valid_id()
         load = Load(
             new_id,
             f"{self.name}-Load",
@@ -84,3 +90,4 @@ class ExtendedWard(Ward):
         core_model.graph.add_edge(bus, int_impedance)
         core_model.graph.add_edge(int_impedance, int_bus)
         core_model.graph.add_edge(int_bus, int_vsource)
+        return new_id + 5
@@ -41,6 +41,35 @@ def get_connected_bus(graph: ComponentGraph, node: Component, max_depth: int = 3
 
     return None
 
+
+def build_connector_index(core_model: CoreModel) -> dict[tuple[int, str], list[Component]]:
+    """Collect the neighbors of every connector in the top level graph of the core model.
+
+    The result equals calling `core_model.get_neighbors(component, connector=connector)`
+    for every component and connector, but only traverses the graph once.
+
+    :param core_model: The CoreModel to build the index for.
+    :type core_model: CoreModel
+    :return: The neighbors of each connector, keyed by the component uid and connector name.
+    :rtype: dict[tuple[int, str], list[Component]]
+    """
+    index: dict[tuple[int, str], list[Component]] = {}
+    linked: dict[tuple[int, str], Component] = {}
+    graph = core_model.graph
+    for component in graph:
+        for neighbor, data in graph[component].items():
+            for connector in dict.fromkeys(data.get(component.uid, [])):
+                key = (component.uid, connector)
+                index.setdefault(key, []).append(neighbor)
+                if isinstance(neighbor, (Port, Subsystem)):
+                    linked[key] = component
+
+    # Connections to subsystems and ports are resolved like in get_neighbors(follow_links=True)
+    for key, component in linked.items():
+        index[key] = core_model.get_neighbors(component, connector=key[1])
+    return index
+
+
 def get_z_base(component: Component, core_model: CoreModel) -> float:
     """Calculate the base impedance (z_base) with the voltage of a connected bus and the base rating.
 
@@ -25,13 +25,18 @@ class Ward(Component):
     q_zload: float = field(default_factory=float)
     """The reactive power of the constant impedance load. The unit is Mvar."""
 
-    def replace_with_load_and_shunt(self, core_model: CoreModel) -> None:
+    def replace_with_load_and_shunt(self, core_model: CoreModel, new_id: int | None = None) -> int:
         """Replaces the Ward equivalent with a Load and a Shunt component in the graph.
 
         :param core_model: The core model to replace the ward in.
         :type core_model: CoreModel
+        :param new_id: The first unused ID for the new components; defaults to None to calculate it
+        :type new_id: int | None, optional
+        :return: The next unused ID after the new components.
+        :rtype: int
         """
-        new_id = core_model.get_valid_id()
+        if new_id is None:
+            new_id = core_model.get_valid_id()
         load = Load(
             new_id,
             f"{self.name}-Load",
@@ -54,3 +59,4 @@ class Ward(Component):
         core_model.add_connection(bus, shunt)
 
         core_model.remove_component(self)
+        return new_id + 2
@@ -17,6 +17,8 @@ class Configuration(metaclass=Singleton):
         """The currently selected platform to get default values for."""
         self.__configs: list[tuple[int, dict]] = []
         """A list of configuration dictionaries and their priorities, always sorted by descending priority."""
+        self.__default_cache: dict[tuple[str, str, Platform | None], Any] = {}
+        """Cached results of get_default, cleared whenever the configurations change."""
 
         self.load_config("config.yml")
 
@@ -47,15 +49,20 @@ class Configuration(metaclass=Singleton):
         :return: The found default value or None.
         :rtype: Any | None
         """
+        if platform is None:
+            platform = self.default_platform
+        key = (component, attr, platform)
+        if key in self.__default_cache:
+            return self.__default_cache[key]
+
         result = None
         if platform is not None:
             result = self.get(f"{platform.value}.{component}.{attr}")
-        elif self.default_platform is not None:
-            result = self.get(f"{self.default_platform.value}.{component}.{attr}")
 
         if result is None:
             # if there is no platform-specific default, look for a global default value
             result = self.get(f"Global.{component}.{attr}")
+        self.__default_cache[key] = result
         return result
 
     def delete_config(self, priority: int) -> bool:
@@ -67,6 +74,7 @@ class Configuration(metaclass=Singleton):
         for i, (pri, _) in enumerate(self.__configs):
             if pri == priority:
                 del self.__configs[i]
+                self.__default_cache.clear()
                 return True
         return False
 
@@ -105,6 +113,7 @@ class Configuration(metaclass=Singleton):
         """Inserts the configuration into the list of configurations at the correct position,
         according to descending priority.
         """
+        self.__default_cache.clear()
         for i, (pri, _) in enumerate(self.__configs):
             if pri == priority:
                 # Overwrite existing configuration
@@ -1,3 +1,6 @@
+from typing import Any
+
+
 class Logger:
     """Global logger for the conversion changes."""
 
@@ -24,6 +27,17 @@ class Logger:
             print(f"[{self.origin}] {message}")
         self.__log_entries.append(message)
 
+    def log_many(self, messages: list[str]) -> None:
+        """Log multiple messages at once.
+
+        :param messages: The messages to log.
+        """
+        if not messages:
+            return
+        if self.print_to_console:
+            print("\n".join(f"[{self.origin}] {message}" for message in messages))
+        self.__log_entries.extend(messages)
+
     def save_to_file(self, file: str) -> None:
         """Save the log entries to a file.
 
@@ -67,17 +81,33 @@ class Logger:
         cls.__selected = handle
 
     @classmethod
-    def log_to_selected(cls, message: str) -> bool:
+    def log_to_selected(cls, message: str, *args: Any) -> bool:
         """Logs a message to the currently selected logger.
+        If [args] are given, the message is %-formatted with them only if a log is selected.
 
         :param message: The message to log.
+        :param args: Optional arguments that are merged into the message.
         :return: True if a log was selected, else False.
         """
         if cls.__selected == -1:
             return False
+        if args:
+            message = message % args
         cls.get(cls.__selected).log(message)
         return True
 
+    @classmethod
+    def log_many_to_selected(cls, messages: list[str]) -> bool:
+        """Logs multiple messages to the currently selected logger at once.
+
+        :param messages: The messages to log.
+        :return: True if a log was selected, else False.
+        """
+        if cls.__selected == -1:
+            return False
+        cls.get(cls.__selected).log_many(messages)
+        return True
+
     @classmethod
     def new(cls, origin: str, select: bool = True, print_to_console: bool = True) -> "Logger":
         """Starts a new conversion changes log.
@@ -47,6 +47,8 @@ PORT_COMPONENT_NAMES = {
     (GdfPort, Subsystem): "Port",
     ExternalGrid: "ExternalGrid",
 }
+_PORT_COMPONENT_NAME_CACHE: dict[type, str] = {}
+"""PORT_COMPONENT_NAMES resolved per concrete component type."""
 
 
 def get_components(
@@ -238,7 +240,11 @@ def get_port_component_name(component: Any) -> str:
     :return: Name for the port
     :rtype: str
     """
+    comp_type = type(component)
+    if comp_type in _PORT_COMPONENT_NAME_CACHE:
+        return _PORT_COMPONENT_NAME_CACHE[comp_type]
     for types, name in PORT_COMPONENT_NAMES.items():
-        if isinstance(component, types):  # type: ignore
+        if issubclass(comp_type, types):  # type: ignore
+            _PORT_COMPONENT_NAME_CACHE[comp_type] = name
             return name
     raise ValueError("Unknown component type")
@@ -1,12 +1,16 @@
+from collections import defaultdict
 from copy import deepcopy
+from typing import TypeVar
+
 from epowcore.gdf.bus import Bus
+from epowcore.gdf.component import Component
 from epowcore.gdf.core_model import CoreModel
 from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
 from epowcore.gdf.load import Load
 from epowcore.gdf.shunt import Shunt
 from epowcore.gdf.tline import TLine
 from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
-from epowcore.gdf.utils import get_connected_bus, get_z_base
+from epowcore.gdf.utils import build_connector_index, get_connected_bus, get_z_base
 from epowcore.generic.logger import Logger
 from epowcore.generic.manipulation.flatten import flatten
 from epowcore.matpower.matpower_model import (
@@ -16,6 +20,8 @@ from epowcore.matpower.matpower_model import (
     MatpowerModel,
 )
 
+T = TypeVar("T")
+
 
 def export_matpower(core_model: CoreModel) -> MatpowerModel:
 
@@ -24,10 +30,18 @@ def export_matpower(core_model: CoreModel) -> MatpowerModel:
     flatten(flat_ds)
 
     base_mva = core_model.base_mva_fb()
+    connector_index = build_connector_index(flat_ds)
+
+    # Group the components by type in a single pass instead of one pass per exported type
+    by_type: dict[type, list[Component]] = defaultdict(list)
+    for component in flat_ds.graph.nodes:
+        by_type[type(component)].append(component)
 
     buses: dict[int, BusDataEntry] = {}
+    # messages for skipped components are flushed to the logger at the end of the export
+    skipped: list[str] = []
 
-    bus_list = flat_ds.type_list(Bus)
+    bus_list = _of_type(by_type, Bus)
     bus_list.sort(key=lambda x: x.uid)
     mpc_bus_id = 1
 
@@ -35,40 +49,41 @@ def export_matpower(core_model: CoreModel) -> MatpowerModel:
         buses[b.uid] = BusDataEntry.from_gdf_bus(b, mpc_bus_id)
         mpc_bus_id += 1
 
-    for load in flat_ds.type_list(Load):
+    for load in _of_type(by_type, Load):
         bus: Bus | None = get_connected_bus(flat_ds.graph, load)
         if bus is None:
-            Logger.log_to_selected(f"No connected bus found for load {load.name}")
+            skipped.append(f"No connected bus found for load {load.name}")
             continue
         buses[bus.uid].demand_p += load.active_power
         buses[bus.uid].demand_q += load.reactive_power
 
-    for shunt in flat_ds.type_list(Shunt):
+    for shunt in _of_type(by_type, Shunt):
         bus = get_connected_bus(flat_ds.graph, shunt)
         if bus is None:
-            Logger.log_to_selected(f"No connected bus found for shunt {shunt.name}")
+            skipped.append(f"No connected bus found for shunt {shunt.name}")
             continue
         buses[bus.uid].shunt_g += shunt.p
         buses[bus.uid].shunt_b += shunt.q
 
     branches: list[BranchDataEntry] = []
 
-    for line in flat_ds.type_list(TLine):
-        bus_from = core_model.get_neighbors(line, connector="A")[0]
-        bus_to = core_model.get_neighbors(line, connector="B")[0]
+    for line in _of_type(by_type, TLine):
+        bus_from = connector_index[(line.uid, "A")][0]
+        bus_to = connector_index[(line.uid, "B")][0]
 
         length = line.length if line.length is not None else 1.0
         r1 = line.r1 * length
         x1 = line.x1 * length
         b1 = line.b1 * length * 1e-6
+        z_base = get_z_base(line, core_model)
 
         branches.append(
             BranchDataEntry(
                 from_bus=buses[bus_from.uid].bus_number,
                 to_bus=buses[bus_to.uid].bus_number,
-                r=r1 / get_z_base(line, core_model),
-                x=x1 / get_z_base(line, core_model),
-                b=b1 * get_z_base(line, core_model),
+                r=r1 / z_base,
+                x=x1 / z_base,
+                b=b1 * z_base,
                 rate_a=line.rating,
                 rate_b=line.rating_short_term_fb(),
                 rate_c=line.rating_emergency_fb(),
@@ -80,9 +95,9 @@ def export_matpower(core_model: CoreModel) -> MatpowerModel:
             )
         )
 
-    for trafo in flat_ds.type_list(TwoWindingTransformer):
-        bus_from = core_model.get_neighbors(trafo, connector="HV")[0]
-        bus_to = core_model.get_neighbors(trafo, connector="LV")[0]
+    for trafo in _of_type(by_type, TwoWindingTransformer):
+        bus_from = connector_index[(trafo.uid, "HV")][0]
+        bus_to = connector_index[(trafo.uid, "LV")][0]
 
         branches.append(
             BranchDataEntry(
@@ -104,10 +119,10 @@ def export_matpower(core_model: CoreModel) -> MatpowerModel:
 
     generators: list[GeneratorDataEntry] = []
 
-    for gen in flat_ds.type_list(SynchronousMachine):
+    for gen in _of_type(by_type, SynchronousMachine):
         bus = get_connected_bus(flat_ds.graph, gen)
         if bus is None:
-            Logger.log_to_selected(f"No connected bus found for generator {gen.name}")
+            skipped.append(f"No connected bus found for generator {gen.name}")
             continue
 
         buses[bus.uid].voltage_mag = gen.voltage_set_point
@@ -138,6 +153,18 @@ def export_matpower(core_model: CoreModel) -> MatpowerModel:
             )
         )
 
+    Logger.log_many_to_selected(skipped)
+
     return MatpowerModel(
         base_mva=base_mva, bus=list(buses.values()), gen=generators, branch=branches
     )
+
+
+def _of_type(by_type: dict[type, list[Component]], comp_type: type[T]) -> list[T]:
+    """Collect the grouped components that are instances of [comp_type].
+
+    :param by_type: The components grouped by their exact type.
+    :param comp_type: The requested type, subclasses included.
+    :return: The components of the requested type.
+    """
+    return [c for t, group in by_type.items() if issubclass(t, comp_type) for c in group]  # type: ignore
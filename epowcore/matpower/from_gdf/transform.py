@@ -57,15 +57,17 @@ def transform(core_model: CoreModel) -> CoreModel:
             core_model_tr.graph.remove_node(n)
 
     # Replace extended Ward equivalents with loads, shunts, impedances and voltage sources
+    # The IDs for the new components are calculated once instead of for each ward
+    next_id = core_model_tr.get_valid_id()
     ext_wards = [n for n in core_model_tr.graph.nodes if isinstance(n, ExtendedWard)]
     for ext_ward in ext_wards:
-        ext_ward.replace_with_load_shunt_vsource(core_model_tr)
+        next_id = ext_ward.replace_with_load_shunt_vsource(core_model_tr, new_id=next_id)
 
     # Replace Ward equivalents with loads and shunts
     # Order is important because ExtendedWard is also a Ward!
     wards = [n for n in core_model_tr.graph.nodes if isinstance(n, Ward)]
     for ward in wards:
-        ward.replace_with_load_and_shunt(core_model_tr)
+        next_id = ward.replace_with_load_and_shunt(core_model_tr, next_id)
 
     # Replace impedances with lines
     impedances = [n for n in core_model_tr.graph.nodes if isinstance(n, Impedance)]
@@ -13,7 +13,7 @@ BUS_TYPE_MAPPING: dict[LFBusType, int] = {
 }
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BusDataEntry:
     bus_number: int
     """Bus number (positive integer)"""
@@ -74,7 +74,7 @@ class BusDataEntry:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GeneratorDataEntry:
     bus_number: int
     """Bus number (positive integer)"""
@@ -148,7 +148,7 @@ class GeneratorDataEntry:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BranchDataEntry:
     from_bus: int
     """'From' bus number"""
@@ -198,7 +198,7 @@ class BranchDataEntry:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MatpowerModel:
     base_mva: float
     version: int = 2
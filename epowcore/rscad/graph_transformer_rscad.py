@@ -118,15 +118,16 @@ class GraphTransformerRscad:
         time = 0.00005
         for tli_file in tli_files:
             if tli_file.name == tline:
-                l0 = tli_file.xind0 / (2 * math.pi * tli_file.frequency)
+                omega = 2 * math.pi * tli_file.frequency
+                l0 = tli_file.xind0 / omega
                 if tli_file.xcap0 != 0:
-                    c0 = 1 / (2 * math.pi * tli_file.frequency * tli_file.xcap0)
+                    c0 = 1 / (omega * tli_file.xcap0)
                 else:
                     c0 = 1
                 time0 = math.sqrt(l0 * c0) * tli_file.length
-                l1 = tli_file.xind1 / (2 * math.pi * tli_file.frequency)
+                l1 = tli_file.xind1 / omega
                 if tli_file.xcap0 != 0:
-                    c1 = 1 / (2 * math.pi * tli_file.frequency * tli_file.xcap1)
+                    c1 = 1 / (omega * tli_file.xcap1)
                 else:
                     c1 = 1
                 time1 = math.sqrt(l1 * c1) * tli_file.length
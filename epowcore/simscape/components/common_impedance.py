@@ -15,15 +15,13 @@ def create_common_impedance(
     core_model: CoreModel,
     model_name: str,
 ) -> SimscapeBlock:
-    neighbors = core_model.get_neighbors(impedance, connector="B")
-    if not neighbors or not isinstance(neighbors[0], Bus):
+    bus_b = core_model.get_single_neighbor(impedance, "B")
+    if not isinstance(bus_b, Bus):
         raise ValueError(f"Could not find connected bus for impedance {impedance.name}")
-    bus_b: Bus = neighbors[0]
 
-    neighbors = core_model.get_neighbors(impedance, connector="A")
-    if not neighbors or not isinstance(neighbors[0], Bus):
+    bus_a = core_model.get_single_neighbor(impedance, "A")
+    if not isinstance(bus_a, Bus):
         raise ValueError(f"Could not find connected bus for impedance {impedance.name}")
-    bus_a: Bus = neighbors[0]
 
     u_base = bus_b.nominal_voltage
     z_base = u_base**2 / impedance.sn_mva
@@ -186,6 +186,31 @@ class CoreModelTest(unittest.TestCase):
         self.assertIn(bus_b, neighbors)
         self.assertEqual(1, len(neighbors))
 
+    def test_get_single_neighbor(self) -> None:
+        core_model = CoreModel(base_frequency=50.0)
+
+        bus_a = Bus(1, "Bus A", lf_bus_type=LFBusType.PQ)
+        bus_b = Bus(2, "Bus B", lf_bus_type=LFBusType.PQ)
+
+        core_model.add_component(bus_a)
+        core_model.add_component(bus_b)
+
+        test_component_creator = GdfTestComponentCreator(50.0)
+        tline = test_component_creator.create_tline("TLine")
+        tline.uid = 3
+        core_model.add_component(tline)
+        core_model.add_connection(tline, bus_a, "A")
+        core_model.add_connection(tline, bus_b, "B")
+
+        self.assertEqual(core_model.get_single_neighbor(tline, "A"), bus_a)
+        self.assertEqual(core_model.get_single_neighbor(tline, "B"), bus_b)
+        self.assertIsNone(core_model.get_single_neighbor(bus_a, "B"))
+
+        # neighbors in subsystems are resolved
+        Subsystem.from_components(core_model, [bus_b])
+        self.assertEqual(core_model.get_single_neighbor(tline, "B"), bus_b)
+        self.assertEqual(core_model.get_single_neighbor(bus_b, ""), tline)
+
     @patch("epowcore.generic.configuration.Configuration")
     def test_base_mva_fb2(self, mock_config):
         Singleton._instances = {
@@ -3,7 +3,8 @@ import unittest
 from epowcore.gdf.bus import Bus, LFBusType
 from epowcore.gdf.core_model import CoreModel
 
-from epowcore.gdf.utils import get_connected_bus
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.gdf.utils import build_connector_index, get_connected_bus
 from tests.helpers.gdf_component_creator import GdfTestComponentCreator
 
 PATH = pathlib.Path(__file__).parent.resolve()
@@ -32,6 +33,34 @@ class UtilsTest(unittest.TestCase):
         bus = get_connected_bus(core_model.graph, tline)
         self.assertIn(bus, (bus_a, bus_b))
 
+    def test_build_connector_index(self) -> None:
+        core_model = CoreModel(base_frequency=50.0)
+
+        bus_a = Bus(1, "Bus A", lf_bus_type=LFBusType.PQ)
+        bus_b = Bus(2, "Bus B", lf_bus_type=LFBusType.PQ)
+
+        core_model.add_component(bus_a)
+        core_model.add_component(bus_b)
+
+        test_component_creator = GdfTestComponentCreator(50.0)
+        tline = test_component_creator.create_tline("TLine")
+        tline.uid = 3
+        core_model.add_component(tline)
+
+        core_model.add_connection(tline, bus_a, "A")
+        core_model.add_connection(tline, bus_b, "B")
+
+        index = build_connector_index(core_model)
+        self.assertEqual(index[(tline.uid, "A")], [bus_a])
+        self.assertEqual(index[(tline.uid, "B")], [bus_b])
+        self.assertEqual(index[(bus_a.uid, "")], [tline])
+
+        # connections to subsystems are resolved to the components inside
+        Subsystem.from_components(core_model, [bus_b])
+        index = build_connector_index(core_model)
+        self.assertEqual(index[(tline.uid, "A")], [bus_a])
+        self.assertEqual(index[(tline.uid, "B")], [bus_b])
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
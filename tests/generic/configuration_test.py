@@ -1,6 +1,7 @@
 import unittest
 
 from epowcore.generic.configuration import Configuration
+from epowcore.generic.constants import Platform
 
 
 class ConfigurationTest(unittest.TestCase):
@@ -34,6 +35,16 @@ class ConfigurationTest(unittest.TestCase):
         Configuration().delete_config(0)
         self.assertEqual(Configuration().get("test.list"), None)
 
+    def test_default_cache(self) -> None:
+        """Tests that cached default values follow configuration changes."""
+        get_default = Configuration().get_default
+        self.assertEqual(get_default("Switch", "rate_a", Platform.MATPOWER), 100.0)
+        self.assertEqual(get_default("Switch", "rate_a", Platform.MATPOWER), 100.0)
+        self.assertTrue(Configuration().load_config("tests/test_default_config.yml", 2))
+        self.assertEqual(get_default("Switch", "rate_a", Platform.MATPOWER), 80.0)
+        Configuration().delete_config(2)
+        self.assertEqual(get_default("Switch", "rate_a", Platform.MATPOWER), 100.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -38,6 +38,28 @@ class LoggingTest(unittest.TestCase):
             content = f.read()
         self.assertEqual(content, "test\nLine 1\nLine 2\n")
 
+    def test_log_many(self) -> None:
+        """Tests logging multiple messages at once."""
+        logger = Logger.new("test", print_to_console=False)
+        logger.log("Line 1")
+        self.assertTrue(Logger.log_many_to_selected(["Line 2", "Line 3"]))
+        self.assertEqual(logger.entries, ["Line 1", "Line 2", "Line 3"])
+
+        Logger.disable()
+        self.assertFalse(Logger.log_many_to_selected(["Line 4"]))
+        self.assertEqual(len(logger.entries), 3)
+
+    def test_log_format_args(self) -> None:
+        """Tests that message arguments are merged into the message."""
+        logger = Logger.new("test", print_to_console=False)
+        self.assertTrue(Logger.log_to_selected("%s = %s", "rate_a", 100.0))
+        self.assertTrue(Logger.log_to_selected("100%"))
+        self.assertEqual(logger.entries, ["rate_a = 100.0", "100%"])
+
+        Logger.disable()
+        self.assertFalse(Logger.log_to_selected("%s = %s", "rate_b", 105.0))
+        self.assertEqual(len(logger.entries), 2)
+
     def tearDown(self) -> None:
         if os.path.exists(LOG_FILE_PATH):
             os.remove(LOG_FILE_PATH)